@@ -11,29 +11,76 @@ Usage:
 """
 
 import argparse
+import asyncio
+import functools
 import json
 import os
 import re
 import shutil
 import sys
 import tempfile
+import xml.etree.ElementTree as ET
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+from xml.sax.saxutils import escape
 
 try:
     import requests
-    from lxml import etree
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
-    print("Required packages missing. Install with: pip install requests lxml")
+    print("Required packages missing. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import aiohttp
+except ImportError:
+    # Without aiohttp we fall back to downloading icons one at a time
+    aiohttp = None
+
 # Configuration
 MATERIAL_ICONS_CDN = "https://fonts.gstatic.com/s/i/materialicons"
 DEFAULT_VERSION = "v4"
 DEFAULT_OUTPUT_DIR = "v2/core/design/src/main/res/drawable"
 ICON_RESOURCES_PATH = "v2/core/design/src/main/java/com/deadarchive/v2/core/design/component/IconResources.kt"
-ICON_REGISTRY_PATTERN = r"object (\w+) \{"
+ICON_REGISTRY_PATTERN = re.compile(r"object (\w+) \{")
+FUN_DEF = re.compile(r'fun\s+(\w+)\(\)')
+CAMEL1 = re.compile(r'(.)([A-Z][a-z]+)')
+CAMEL2 = re.compile(r'([a-z0-9])([A-Z])')
+SVG_NS = "http://www.w3.org/2000/svg"
+SVG_TAG = f"{{{SVG_NS}}}svg"
+SVG_PATH_TAG = f"{{{SVG_NS}}}path"
+ANDROID_NS = "http://schemas.android.com/apk/res/android"
+MAX_CONCURRENT_DOWNLOADS = 16
+
+# Vector drawables always have the same shape, so they're rendered from templates
+VECTOR_TMPL = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    f'<vector xmlns:android="{ANDROID_NS}" android:width="{{width}}dp" android:height="{{height}}dp" '
+    'android:viewportWidth="{width}" android:viewportHeight="{height}" android:tint="?attr/colorControlNormal">\n'
+    '{paths}'
+    '</vector>\n'
+)
+PATH_TMPL = '  <path android:fillColor="{fill}" android:pathData="{d}"/>\n'
+XML_ATTR_ENTITIES = {'"': "&quot;"}
+
+# Material SVGs are a single <svg viewBox="0 0 24 24"> with a few <path> children,
+# which these patterns can pick apart without a full XML parse
+FAST_SVG_TAG = re.compile(rb'<svg\b([^>]*)>')
+FAST_PATH = re.compile(rb'<path\b([^>]*?)/?>')
+FAST_ATTR = re.compile(rb'([\w:-]+)\s*=\s*"([^"]*)"')
+# Markup the regexes would misread, e.g. a <path> inside a comment
+FAST_PATH_BAIL_OUT = re.compile(rb"&|=\s*'|<!--|<!\[CDATA\[")
+
+# Shared session so connections to the CDN are kept alive between icons
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    # Hand the final 5xx back to the caller so it can try the alternative version
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+))
 
 # Icon styles mapping
 STYLES = {
@@ -66,153 +113,244 @@ def parse_arguments():
                       help='Category in IconResources to add icons to')
     parser.add_argument('--dry-run', action='store_true', 
                       help='Show what would be downloaded without downloading')
+    parser.add_argument('--aggressive-retry', action='store_true',
+                      help='Request the fallback icon version in parallel with the primary one (aiohttp only)')
     
     return parser.parse_args()
 
+@functools.lru_cache(maxsize=4096)
 def snake_to_camel_case(name: str) -> str:
     """Convert snake_case to camelCase."""
-    components = name.split('_')
-    return components[0] + ''.join(x.title() for x in components[1:])
+    head, _, tail = name.partition('_')
+    return head + tail.title().replace('_', '') if tail else head
 
 def camel_to_snake_case(name: str) -> str:
     """Convert camelCase to snake_case."""
-    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+    name = CAMEL1.sub(r'\1_\2', name)
+    return CAMEL2.sub(r'\1_\2', name).lower()
 
-def download_icon_svg(icon_name: str, style: str, version: str) -> Optional[bytes]:
-    """Download SVG icon from Google's Material Icons CDN."""
+def icon_url(icon_name: str, style: str, version: str) -> str:
+    """Build the CDN URL for an icon."""
     # For non-filled styles, use the style subdirectory
     style_path = f"/{STYLES[style]}" if STYLES[style] else ""
+    return f"{MATERIAL_ICONS_CDN}{style_path}/{icon_name}/{version}/24px.svg"
+
+def alternative_version(version: str) -> str:
+    """Version to retry with when an icon is missing (v7 is also common)."""
+    return "v7" if version != "v7" else "v5"
+
+def svg_cache_path(icon_name: str, style: str, version: str) -> Path:
+    """Location of the cached SVG for an icon, under $XDG_CACHE_HOME or ~/.cache."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_root / "material-icons" / style / version / f"{icon_name}.svg"
+
+def read_cached_svg(icon_name: str, style: str, version: str) -> Optional[bytes]:
+    """Return the cached SVG for an icon, or None if it hasn't been downloaded before."""
+    try:
+        return svg_cache_path(icon_name, style, version).read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        # Treat an unreadable entry as a miss and download the icon again
+        print(f"Warning: could not read cached {icon_name}: {e}")
+        return None
+
+def write_cached_svg(icon_name: str, style: str, version: str, svg_content: bytes) -> None:
+    """Atomically store a downloaded SVG in the cache."""
+    cache_path = svg_cache_path(icon_name, style, version)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False) as f:
+            f.write(svg_content)
+        os.replace(f.name, cache_path)
+    except OSError as e:
+        print(f"Warning: could not cache {icon_name}: {e}")
+
+def download_icon_svg(icon_name: str, style: str, version: str) -> Optional[bytes]:
+    """Download SVG icon from Google's Material Icons CDN."""
+    cached = read_cached_svg(icon_name, style, version)
+    if cached is not None:
+        return cached
     
-    url = f"{MATERIAL_ICONS_CDN}{style_path}/{icon_name}/{version}/24px.svg"
-    response = requests.get(url)
-    
-    if response.status_code != 200:
-        # Try alternative version (v7 is also common)
-        alt_version = "v7" if version != "v7" else "v5"
-        url = f"{MATERIAL_ICONS_CDN}{style_path}/{icon_name}/{alt_version}/24px.svg"
-        response = requests.get(url)
+    try:
+        response = SESSION.get(icon_url(icon_name, style, version), timeout=10)
         
         if response.status_code != 200:
-            print(f"Error downloading {icon_name}: HTTP {response.status_code}")
-            return None
+            # Try alternative version
+            response = SESSION.get(icon_url(icon_name, style, alternative_version(version)), timeout=10)
+    except requests.RequestException as e:
+        print(f"Error downloading {icon_name}: {e}")
+        return None
+    
+    if response.status_code != 200:
+        print(f"Error downloading {icon_name}: HTTP {response.status_code}")
+        return None
     
+    write_cached_svg(icon_name, style, version, response.content)
     return response.content
 
-def convert_svg_to_vector_drawable(svg_content: bytes) -> bytes:
-    """Convert SVG to Android Vector Drawable XML format."""
-    # Parse SVG
-    parser = etree.XMLParser(remove_blank_text=True)
-    svg_tree = etree.parse(BytesIO(svg_content), parser)
-    svg_root = svg_tree.getroot()
+async def fetch_url(session, url: str) -> Tuple[int, Optional[bytes]]:
+    """GET a URL, returning the status and the body if it was a 200."""
+    async with session.get(url) as response:
+        if response.status != 200:
+            return response.status, None
+        return response.status, await response.read()
+
+async def fetch_svg(session, icon_name: str, style: str, version: str, aggressive_retry: bool = False) -> Optional[bytes]:
+    """Download SVG icon from Google's Material Icons CDN using a shared aiohttp session."""
+    # Cache I/O runs in the executor so it doesn't block other in-flight downloads
+    loop = asyncio.get_running_loop()
+    cached = await loop.run_in_executor(None, read_cached_svg, icon_name, style, version)
+    if cached is not None:
+        return cached
+    
+    primary_url = icon_url(icon_name, style, version)
+    fallback_url = icon_url(icon_name, style, alternative_version(version))
+    
+    if aggressive_retry:
+        # Request the alternative version up front so a miss on the primary costs no extra round trip
+        fallback = asyncio.create_task(fetch_url(session, fallback_url))
+        # If the primary wins, the fallback's error (e.g. a reset connection) is deliberately ignored
+        fallback.add_done_callback(lambda task: task.cancelled() or task.exception())
+        try:
+            status, content = await fetch_url(session, primary_url)
+            if content is None:
+                status, content = await fallback
+        finally:
+            fallback.cancel()
+    else:
+        status, content = await fetch_url(session, primary_url)
+        if content is None:
+            # Try alternative version
+            status, content = await fetch_url(session, fallback_url)
     
-    # Create Vector Drawable
-    ns = {"android": "http://schemas.android.com/apk/res/android"}
-    vector = etree.Element("vector", nsmap=ns)
+    if content is None:
+        print(f"Error downloading {icon_name}: HTTP {status}")
+        return None
     
-    # Extract width/height from viewBox
-    viewbox = svg_root.get("viewBox", "0 0 24 24")
+    await loop.run_in_executor(None, write_cached_svg, icon_name, style, version, content)
+    return content
+
+def viewport_size(svg_attrs) -> Tuple[str, str]:
+    """Extract width/height from the <svg> attributes, defaulting to the viewBox."""
+    viewbox = svg_attrs.get("viewBox", "0 0 24 24")
     vb_parts = viewbox.split()
-    width = svg_root.get("width", vb_parts[2]) if len(vb_parts) >= 3 else "24"
-    height = svg_root.get("height", vb_parts[3]) if len(vb_parts) >= 4 else "24"
-    
-    # Set Vector attributes
-    vector.set("{http://schemas.android.com/apk/res/android}width", f"{width}dp")
-    vector.set("{http://schemas.android.com/apk/res/android}height", f"{height}dp")
-    vector.set("{http://schemas.android.com/apk/res/android}viewportWidth", width)
-    vector.set("{http://schemas.android.com/apk/res/android}viewportHeight", height)
-    vector.set("{http://schemas.android.com/apk/res/android}tint", "?attr/colorControlNormal")
-    
-    # Process SVG paths to Vector paths
-    paths = svg_root.findall(".//{http://www.w3.org/2000/svg}path")
-    for path in paths:
-        path_data = path.get("d")
-        fill = path.get("fill", "#000000")
-        
-        # Skip "none" fill paths which are usually just bounding boxes
-        if fill == "none":
-            continue
-            
-        path_element = etree.SubElement(vector, "path")
-        path_element.set("{http://schemas.android.com/apk/res/android}fillColor", fill)
-        path_element.set("{http://schemas.android.com/apk/res/android}pathData", path_data)
-    
-    # Generate formatted XML - Fixed to avoid double XML declaration
-    vector_drawable = b'<?xml version="1.0" encoding="utf-8"?>\n' + etree.tostring(
-        vector, 
-        pretty_print=True,
-        encoding="utf-8",
-        xml_declaration=False
-    )
+    width = svg_attrs.get("width", vb_parts[2]) if len(vb_parts) >= 3 else "24"
+    height = svg_attrs.get("height", vb_parts[3]) if len(vb_parts) >= 4 else "24"
+    return width, height
+
+def extract_svg_shapes_fast(svg_content: bytes) -> Optional[Tuple[str, str, List[Tuple[str, str]]]]:
+    """Pull the viewport and (fill, pathData) pairs out of a plain Material SVG.
+    
+    Returns None when the SVG uses anything the regexes can't handle safely
+    (entities, single-quoted attributes, comments, CDATA, paths without data,
+    namespaces other than a plain default SVG one).
+    """
+    if FAST_PATH_BAIL_OUT.search(svg_content):
+        return None
+    
+    svg_tag = FAST_SVG_TAG.search(svg_content)
+    if not svg_tag:
+        return None
     
-    return vector_drawable
+    svg_attrs = {k.decode(): v.decode() for k, v in FAST_ATTR.findall(svg_tag.group(1))}
+    if svg_attrs.get("xmlns") != SVG_NS:
+        return None
+    width, height = viewport_size(svg_attrs)
+    
+    paths = []
+    for match in FAST_PATH.finditer(svg_content, svg_tag.end()):
+        path_attrs = dict(FAST_ATTR.findall(match.group(1)))
+        if b"d" not in path_attrs or b"xmlns" in path_attrs:
+            return None
+        paths.append((path_attrs.get(b"fill", b"#000000").decode(), path_attrs[b"d"].decode()))
+    
+    return width, height, paths
 
-def save_vector_drawable(vector_content: bytes, icon_name: str, output_dir: str) -> str:
-    """Save vector drawable to the appropriate resource directory."""
-    # Create directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+def extract_svg_shapes(svg_content: bytes) -> Tuple[str, str, List[Tuple[str, str]]]:
+    """Pull the viewport and (fill, pathData) pairs out of any SVG with a streaming parse."""
+    width = height = "24"
+    paths = []
+    
+    # Stream the SVG so only the root and the current path are ever held in memory
+    for event, elem in ET.iterparse(BytesIO(svg_content), events=("start", "end")):
+        if event == "start" and elem.tag == SVG_TAG:
+            width, height = viewport_size(elem)
+        elif event == "end" and elem.tag == SVG_PATH_TAG:
+            paths.append((elem.get("fill", "#000000"), elem.get("d")))
+            elem.clear()
     
-    # Save vector drawable
-    icon_filename = f"ic_{icon_name}.xml"
-    output_path = os.path.join(output_dir, icon_filename)
+    return width, height, paths
+
+def convert_svg_to_vector_drawable(svg_content: bytes) -> bytes:
+    """Convert SVG to Android Vector Drawable XML format."""
+    shapes = extract_svg_shapes_fast(svg_content)
+    if shapes is None:
+        shapes = extract_svg_shapes(svg_content)
+    width, height, svg_paths = shapes
     
-    with open(output_path, 'wb') as f:
-        f.write(vector_content)
+    # Skip "none" fill paths which are usually just bounding boxes
+    paths = "".join(
+        PATH_TMPL.format(fill=escape(fill, XML_ATTR_ENTITIES), d=escape(path_data, XML_ATTR_ENTITIES))
+        for fill, path_data in svg_paths
+        if fill != "none"
+    )
     
+    return VECTOR_TMPL.format(
+        width=escape(width, XML_ATTR_ENTITIES),
+        height=escape(height, XML_ATTR_ENTITIES),
+        paths=paths
+    ).encode("utf-8")
+
+def save_vector_drawable(vector_content: bytes, icon_name: str, output_dir: str) -> str:
+    """Save vector drawable to the appropriate resource directory (which must already exist)."""
+    output_path = os.path.join(output_dir, f"ic_{icon_name}.xml")
+    Path(output_path).write_bytes(vector_content)
     return output_path
 
-def analyze_icon_registry(icon_names: List[str], registry_path: str, category: str) -> Dict[str, List[str]]:
-    """Analyze IconResources.kt and report which icons already exist and which are new."""
+class RegistryIndex(NamedTuple):
+    """IconResources.kt parsed once and shared across categories."""
+    existing_functions: Set[str]
+    categories: List[str]
+
+def load_registry(registry_path: str) -> Optional[RegistryIndex]:
+    """Read IconResources.kt and index its functions and category objects."""
     if not os.path.exists(registry_path):
         print(f"Error: Icon registry file not found at {registry_path}")
-        return {'existing': [], 'new': icon_names}
+        return None
     
-    # Read the registry file
     with open(registry_path, 'r') as f:
         content = f.read()
     
-    # Check the entire file for existing functions
-    existing_functions = set()
-    for match in re.finditer(r'fun\s+(\w+)\(\)', content):
-        existing_functions.add(match.group(1))
-    
-    # Find the specified category object
-    pattern = f"object {category} {{"
-    category_pos = content.find(pattern)
+    return RegistryIndex(
+        existing_functions=set(FUN_DEF.findall(content)),
+        categories=ICON_REGISTRY_PATTERN.findall(content)
+    )
+
+def analyze_icon_registry(icon_names: List[str], registry: Optional[RegistryIndex], category: str) -> Dict[str, List[str]]:
+    """Analyze IconResources.kt and report which icons already exist and which are new."""
+    if registry is None:
+        return {'existing': [], 'new': icon_names, 'category': category}
     
-    if category_pos == -1:
+    if category not in registry.categories:
         print(f"Category '{category}' not found in IconResources.kt")
         print("Available categories:")
-        for match in re.finditer(ICON_REGISTRY_PATTERN, content):
-            print(f"  - {match.group(1)}")
-        return {'existing': [], 'new': icon_names}
-    
-    # Find the end of the category block
-    open_braces = 1
-    category_end_pos = category_pos + len(pattern)
-    for i in range(category_end_pos, len(content)):
-        if content[i] == '{':
-            open_braces += 1
-        elif content[i] == '}':
-            open_braces -= 1
-            if open_braces == 0:
-                category_end_pos = i
-                break
+        for name in registry.categories:
+            print(f"  - {name}")
+        return {'existing': [], 'new': icon_names, 'category': category}
     
     # Categorize the icons
     existing_icons = []
     new_icons = []
-    suggestions = []
     
     for icon_name in icon_names:
         camel_case_name = snake_to_camel_case(icon_name)
         
         # Check if icon exists in this category or elsewhere in the file
-        if camel_case_name in existing_functions:
+        if camel_case_name in registry.existing_functions:
             existing_icons.append(icon_name)
         else:
             new_icons.append(icon_name)
-            # We don't generate code suggestions anymore, just track which icons are new
     
     return {
         'existing': existing_icons,
@@ -238,17 +376,71 @@ def load_icons_from_json(json_path: str) -> Dict[str, List[str]]:
         print(f"Error loading JSON: {e}")
         sys.exit(1)
 
+def convert_and_write(svg_content: bytes, icon_name: str, output_dir: str) -> str:
+    """Convert a downloaded SVG to a vector drawable and save it, returning the saved path."""
+    vector_content = convert_svg_to_vector_drawable(svg_content)
+    return save_vector_drawable(vector_content, icon_name, output_dir)
+
+def convert_and_save(svg_content: bytes, icon_name: str, output_dir: str) -> bool:
+    """Convert a downloaded SVG to a vector drawable and save it, reporting the outcome."""
+    try:
+        output_path = convert_and_write(svg_content, icon_name, output_dir)
+    except Exception as e:
+        print(f"❌ Error processing {icon_name}: {str(e)}")
+        return False
+    
+    print(f"✨ Downloaded new icon {icon_name} to {output_path}")
+    return True
+
+async def fetch_and_convert(session, icon_name: str, args) -> bool:
+    """Download a single icon and convert it, overlapping conversion with other downloads."""
+    try:
+        svg_content = await fetch_svg(session, icon_name, args.style, args.version, args.aggressive_retry)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Error downloading {icon_name}: {str(e) or type(e).__name__}")
+        return False
+    if not svg_content:
+        return False
+    
+    # Parsing and writing run in a worker thread so they don't block the event loop;
+    # reporting stays on the event loop so output from different icons doesn't interleave
+    loop = asyncio.get_running_loop()
+    try:
+        output_path = await loop.run_in_executor(None, convert_and_write, svg_content, icon_name, args.output)
+    except Exception as e:
+        print(f"❌ Error processing {icon_name}: {str(e)}")
+        return False
+    
+    print(f"✨ Downloaded new icon {icon_name} to {output_path}")
+    return True
+
+async def run_all(icon_names: List[str], args) -> List[bool]:
+    """Download and convert all icons concurrently over one connection pool."""
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS)
+    # Per-socket limits like requests' timeout=10; a total limit would also count
+    # time spent queued behind the connector, failing large batches
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(
+            *(fetch_and_convert(session, icon_name, args) for icon_name in icon_names)
+        )
+
 def process_icons(icon_names: List[str], args) -> Dict[str, List[str]]:
     """Download, convert and save icons that don't already exist."""
     newly_downloaded = []
     already_exist = []
     failed = []
+    to_download = []
+    
+    # Snapshot the output directory once instead of checking each icon separately
+    existing_files = {entry.name for entry in os.scandir(args.output)} if os.path.isdir(args.output) else set()
     
     for icon_name in icon_names:
         # Check if icon already exists in the output directory
-        icon_path = os.path.join(args.output, f"ic_{icon_name}.xml")
+        icon_filename = f"ic_{icon_name}.xml"
+        icon_path = os.path.join(args.output, icon_filename)
         
-        if os.path.exists(icon_path):
+        if icon_filename in existing_files:
             print(f"✅ Icon {icon_name} already exists at {icon_path}")
             already_exist.append(icon_name)
             continue
@@ -260,23 +452,24 @@ def process_icons(icon_names: List[str], args) -> Dict[str, List[str]]:
             newly_downloaded.append(icon_name)
             continue
         
-        # Download SVG directly
-        svg_content = download_icon_svg(icon_name, args.style, args.version)
-        if not svg_content:
-            failed.append(icon_name)
-            continue
-        
-        # Convert to Vector Drawable
-        try:
-            vector_content = convert_svg_to_vector_drawable(svg_content)
+        to_download.append(icon_name)
+    
+    succeeded = []
+    if to_download:
+        # Create directory once up front rather than for every saved icon
+        os.makedirs(args.output, exist_ok=True)
         
-            # Save Vector Drawable
-            output_path = save_vector_drawable(vector_content, icon_name, args.output)
-            print(f"✨ Downloaded new icon {icon_name} to {output_path}")
-            
+        if aiohttp is not None:
+            succeeded = asyncio.run(run_all(to_download, args))
+        else:
+            for icon_name in to_download:
+                svg_content = download_icon_svg(icon_name, args.style, args.version)
+                succeeded.append(bool(svg_content) and convert_and_save(svg_content, icon_name, args.output))
+    
+    for icon_name, ok in zip(to_download, succeeded):
+        if ok:
             newly_downloaded.append(icon_name)
-        except Exception as e:
-            print(f"❌ Error processing {icon_name}: {str(e)}")
+        else:
             failed.append(icon_name)
     
     return {
@@ -302,6 +495,9 @@ def main():
         for category_icons in categories.values():
             icons_to_process.extend(category_icons)
     
+    # Icons shared between categories only need to be downloaded once
+    icons_to_process = list(dict.fromkeys(icons_to_process))
+    
     # Process the icons
     results = process_icons(icons_to_process, args)
     newly_downloaded_icons = results['newly_downloaded']
@@ -326,11 +522,14 @@ def main():
         print("\n📋 Icon Analysis Results:")
         print("=======================")
         
+        registry = load_registry(args.icon_registry_path)
+        newly_downloaded_set = set(newly_downloaded_icons)
+        
         for category, category_icons in categories.items():
             # Only include icons that were newly downloaded
-            icons_to_analyze = [icon for icon in category_icons if icon in newly_downloaded_icons]
+            icons_to_analyze = [icon for icon in category_icons if icon in newly_downloaded_set]
             if icons_to_analyze:
-                results = analyze_icon_registry(icons_to_analyze, args.icon_registry_path, category)
+                results = analyze_icon_registry(icons_to_analyze, registry, category)
                 
                 print(f"\n📁 Category: {results['category']}")
                 